@@ -0,0 +1,28 @@
+"""
+Test package for the Product Service
+"""
+import os
+from sqlalchemy.engine import make_url
+
+BASE_DATABASE_URI = os.getenv("TEST_DATABASE_URI", "sqlite:///:memory:")
+
+
+def worker_database_uri(uri: str, worker: str) -> str:
+    """Returns the database uri with the worker id appended to its name"""
+    url = make_url(uri)
+    if not url.database or url.database == ":memory:":
+        return uri  # in-memory databases are already private to each process
+    return url.set(database=f"{url.database}_{worker}").render_as_string(hide_password=False)
+
+
+# pytest-xdist runs every worker in its own process, give each its own database
+# (the app included, so workers don't race to create tables in a shared one)
+if os.getenv("PYTEST_XDIST_WORKER"):
+    os.environ["TEST_DATABASE_URI"] = worker_database_uri(
+        BASE_DATABASE_URI, os.environ["PYTEST_XDIST_WORKER"]
+    )
+    os.environ["DATABASE_URI"] = os.environ["TEST_DATABASE_URI"]
+
+# The service connects to its database as soon as it is imported, so point it
+# at the test database first; otherwise the suite would need a live PostgreSQL
+os.environ.setdefault("DATABASE_URI", os.getenv("TEST_DATABASE_URI", BASE_DATABASE_URI))
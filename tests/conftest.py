@@ -0,0 +1,54 @@
+"""
+pytest configuration for the Product Service tests
+
+Run the suite in parallel with:
+    pytest -n auto
+"""
+import os
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+from tests import BASE_DATABASE_URI
+
+
+def pytest_configure(config):
+    """Provisions the PostgreSQL databases used by pytest-xdist workers
+
+    The controlling process creates the tables once in a template database,
+    then every worker gets its own copy of it, which PostgreSQL makes by
+    copying files instead of replaying the DDL.
+    """
+    base = make_url(BASE_DATABASE_URI)
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if base.get_backend_name() != "postgresql":
+        return
+    if worker is None and not getattr(config.option, "numprocesses", None):
+        return  # a plain run just uses the database it was given
+    template = f"{base.database}_template"
+    engine = create_engine(base, isolation_level="AUTOCOMMIT")
+    with engine.connect() as conn:
+        if worker is None:
+            _create_template(conn, base.set(database=template))
+        else:
+            name = make_url(os.environ["TEST_DATABASE_URI"]).database
+            conn.execute(text(f'DROP DATABASE IF EXISTS "{name}"'))
+            conn.execute(text(f'CREATE DATABASE "{name}" TEMPLATE "{template}"'))
+    engine.dispose()
+
+
+def _create_template(conn, url):
+    """(Re)creates the template database at url with the current schema"""
+    # pylint: disable=import-outside-toplevel
+    from service.models import db
+
+    template = url.database
+    found = conn.execute(
+        text("SELECT 1 FROM pg_database WHERE datname = :name"), {"name": template}
+    ).scalar()
+    if found:
+        conn.execute(text(f'ALTER DATABASE "{template}" IS_TEMPLATE false'))
+        conn.execute(text(f'DROP DATABASE "{template}"'))
+    conn.execute(text(f'CREATE DATABASE "{template}"'))
+    schema_engine = create_engine(url)
+    db.metadata.create_all(schema_engine)
+    schema_engine.dispose()  # no one may be connected to a template while it is copied
+    conn.execute(text(f'ALTER DATABASE "{template}" IS_TEMPLATE true'))
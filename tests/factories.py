@@ -29,7 +29,6 @@ class ProductFactory(factory.Factory):
         """Maps factory to data model"""
         model = Product
 
-    id = factory.Sequence(lambda n: n)
     name = FuzzyChoice(choices=['Hat', 'Pants', 'Shirt', 'Apple', 'Banana',
                                 'Pots', 'Towels', 'Ford', 'Chevy', 'Hammer', 'Wrench'])
     description = factory.Faker('text')